@@ -196,33 +196,84 @@ True
 True
 """
 
-from dataclasses import dataclass
 from itertools import chain
-from numbers import Real
 from operator import itemgetter
 
-from itree import ITree
+import numpy as np
 
 
-__all__ = ["Rect"]
+__all__ = ["Rect", "RectArray"]
 
 
-def bounded_by(*limiters):
-    """
-    Create a function from limiters that takes any number of rects and
-    applies these limiters to their corresponding coordinates.
-    """
+# Below this many rects a plain Python loop beats the cost of building
+# an array; above it the reductions run as C-level SIMD loops.
+SMALL = 32
 
-    def bound(*rects):
-        "Return the upper or lower bound of rects, depending on limiters."
-        for limit, coordinates in zip(limiters, zip(*rects)):
-            yield limit(coordinates)
+# Below this many rects the broadcasted O(n^2) overlap test beats the
+# plane sweep, whose event sort and tree bookkeeping dominate at small n.
+BRUTE = 512
 
-    return bound
 
-
-inflate = bounded_by(min, min, max, max)
-deflate = bounded_by(max, max, min, min)
+def inflate(*rects):
+    """
+    Return the coordinates of the smallest box that contains all rects,
+    or the empty tuple, if rects is empty.
+    """
+    if not rects:
+        return ()
+    if len(rects) >= SMALL:
+        arr = np.asarray(rects)
+        # Exotic coordinate types (big ints, Fraction, ...) come through
+        # as an object array whose reductions return the raw Python
+        # object instead of a NumPy scalar; reduce those in Python.
+        if arr.dtype != object:
+            return (
+                arr[:, 0].min().item(),
+                arr[:, 1].min().item(),
+                arr[:, 2].max().item(),
+                arr[:, 3].max().item(),
+            )
+    x0, y0, x1, y1 = rects[0]
+    for r in rects[1:]:
+        if r[0] < x0:
+            x0 = r[0]
+        if r[1] < y0:
+            y0 = r[1]
+        if r[2] > x1:
+            x1 = r[2]
+        if r[3] > y1:
+            y1 = r[3]
+    return x0, y0, x1, y1
+
+
+def deflate(*rects):
+    """
+    Return the coordinates of the greatest box that is contained in all
+    rects, or the empty tuple, if rects is empty or contains an empty box.
+    """
+    if not rects or not all(rects):
+        return ()
+    if len(rects) >= SMALL:
+        arr = np.asarray(rects)
+        # See inflate: object arrays have no NumPy scalar reductions.
+        if arr.dtype != object:
+            return (
+                arr[:, 0].max().item(),
+                arr[:, 1].max().item(),
+                arr[:, 2].min().item(),
+                arr[:, 3].min().item(),
+            )
+    x0, y0, x1, y1 = rects[0]
+    for r in rects[1:]:
+        if r[0] > x0:
+            x0 = r[0]
+        if r[1] > y0:
+            y0 = r[1]
+        if r[2] < x1:
+            x1 = r[2]
+        if r[3] < y1:
+            y1 = r[3]
+    return x0, y0, x1, y1
 
 
 X0, Y0, X1, Y1 = range(4)
@@ -243,60 +294,58 @@ vertical = itemgetter(Y0, Y1)
 
 def points(rect):
     """Return the left top and right bottom points of rect."""
-    return left_top(rect), right_bottom(rect)
+    return (rect[X0], rect[Y0]), (rect[X1], rect[Y1])
 
 
 def width(rect):
     """Return the width of rect."""
-    return right(rect) - left(rect)
+    return rect[X1] - rect[X0]
 
 
 def height(rect):
     """Return the height of rect."""
-    return bottom(rect) - top(rect)
+    return rect[Y1] - rect[Y0]
 
 
 def size(rect):
     """Return the width and height of rect."""
-    return width(rect), height(rect)
+    return rect[X1] - rect[X0], rect[Y1] - rect[Y0]
 
 
 def area(rect):
     """Return the area of rect."""
-    return width(rect) * height(rect)
+    return (rect[X1] - rect[X0]) * (rect[Y1] - rect[Y0])
 
 
 prop_doc = "The {0} of the rectangle.".format
 coor_doc = prop_doc("{0} coordinate").format
 
 
-invalid = ValueError('Argument "box" must be an iterable of zero or four numbers.')
+INVALID = 'Argument "box" must be an iterable of zero or four numbers.'
 
 
-class MetaRect(type(tuple)):
-    """
-    A metaclass so we can have covariant polymorphic subtypes.
+tuple_new = tuple.__new__
 
-    Really.
-    """
 
-    def __init__(cls, name, bases, cdict):
-        """
-        Set up the two identity elements.
-        """
-        # We must do this in a metaclass so users are able to properly subclass
-        # Rect. Otherwise a method that's invoked on e.g. a module level
-        # attribute EMPTY would always return a Rect instance, even if the user
-        # had subclassed Rect.  Creating these constants automatically on a
-        # per-class-level does the trick.
-        inf = float("inf")
-        cls.EMPTY = cls(())
-        cls.PLANE = cls((-inf, -inf, inf, inf))
+inf = float("inf")
 
 
-class Rect(tuple, metaclass=MetaRect):
+class Rect(tuple):
     __slots__ = ()
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Set up the two identity elements.
+        """
+        # We must do this for every subclass so users are able to properly
+        # subclass Rect. Otherwise a method that's invoked on e.g. a module
+        # level attribute EMPTY would always return a Rect instance, even if
+        # the user had subclassed Rect.  Creating these constants
+        # automatically on a per-class-level does the trick.
+        super().__init_subclass__(**kwargs)
+        cls.EMPTY = tuple_new(cls)
+        cls.PLANE = tuple_new(cls, (-inf, -inf, inf, inf))
+
     left = property(left, doc=coor_doc("left"))
     right = property(right, doc=coor_doc("right"))
     top = property(top, doc=coor_doc("top"))
@@ -329,19 +378,30 @@ class Rect(tuple, metaclass=MetaRect):
 
         Raises ValueError if box is not iterable or of the wrong size.
         """
-        try:
-            box = tuple(box)
-        except TypeError:
-            raise invalid
-        match box:
-            case (x0, y0, x1, y1) if x0 <= x1 and y0 <= y1:
-                return tuple.__new__(cls, box)
-            case (x0, y0, x1, y1):
-                return tuple.__new__(cls)
-            case ():
-                return tuple.__new__(cls)
-            case _:
-                raise invalid
+        if box.__class__ is cls:
+            return box
+        if type(box) is not tuple:
+            try:
+                box = tuple(box)
+            except TypeError:
+                raise ValueError(INVALID)
+        if len(box) == 4:
+            if box[0] <= box[2] and box[1] <= box[3]:
+                return tuple_new(cls, box)
+            return cls.EMPTY
+        if not box:
+            return cls.EMPTY
+        raise ValueError(INVALID)
+
+    @classmethod
+    def _make(cls, x0, y0, x1, y1):
+        """
+        Build a rectangle from four trusted coordinates, skipping the
+        iteration and the size check in __new__.
+        """
+        if x0 <= x1 and y0 <= y1:
+            return tuple_new(cls, (x0, y0, x1, y1))
+        return cls.EMPTY
 
     @classmethod
     def from_size(cls, size):
@@ -370,7 +430,20 @@ class Rect(tuple, metaclass=MetaRect):
         If any of the rects equals Rect.PLANE, the result will also be
         Rect.PLANE.
         """
-        return cls(inflate(*filter(None, rects)))
+        # One pass over the arguments: PLANE absorbs everything (a
+        # pointer comparison beats reducing over its infinities), and
+        # empty rects are the identity and get dropped.
+        plane = cls.PLANE
+        finite = []
+        for rect in rects:
+            if rect is plane:
+                return plane
+            if rect:
+                finite.append(rect)
+        coords = inflate(*finite)
+        if coords:
+            return cls._make(*coords)
+        return cls.EMPTY
 
     @classmethod
     def intersection(cls, *rects):
@@ -382,10 +455,26 @@ class Rect(tuple, metaclass=MetaRect):
         If any of the rects equals Rect.EMPTY, the result will also be
         Rect.EMPTY.
         """
-        return cls(deflate(cls.PLANE, *rects))
+        # One pass over the arguments: EMPTY absorbs everything (a
+        # pointer comparison beats reducing just to find a degenerate
+        # result), and PLANE is the identity and gets dropped.
+        empty = cls.EMPTY
+        plane = cls.PLANE
+        finite = []
+        for rect in rects:
+            if rect is empty:
+                return empty
+            if rect is not plane:
+                finite.append(rect)
+        if not finite:
+            return plane
+        coords = deflate(*finite)
+        if coords:
+            return cls._make(*coords)
+        return empty
 
     @classmethod
-    def partitions(cls, rects):
+    def partitions(cls, rects, unique=False):
         """
         Partition rects into distinct sets of transitively intersecting
         rectangles.
@@ -397,13 +486,16 @@ class Rect(tuple, metaclass=MetaRect):
         Since Rect.EMPTY trivially intersects with any other rect,
         it is always discarded.
 
+        If unique is true, rects are trusted to contain no duplicates and
+        the deduplication pass over them is skipped.
+
         Time complexity is O(n log n + k) with respect to the number of distinct
         rects n and the number of intersections k. I hope.
         """
-        return _connected_components(rects)
+        return _connected_components(rects, unique)
 
     @classmethod
-    def bounding_boxes(cls, rects):
+    def bounding_boxes(cls, rects, unique=False):
         """
         Join each distinct set of transitively intersecting rectangles in
         rects into a bounding box.
@@ -416,10 +508,13 @@ class Rect(tuple, metaclass=MetaRect):
         Since Rect.EMPTY intersects with nothing and is intersected by any other
         rect, it is always discarded.
 
+        If unique is true, rects are trusted to contain no duplicates and
+        the deduplication pass over them is skipped.
+
         Time complexity is O(n log n + k) with respect to the number n
         of distinct rects and the number k of intersection. I hope.
         """
-        for region in cls.partitions(rects):
+        for region in cls.partitions(rects, unique):
             yield cls.bounding_box(*region)
 
     def move(self, offsets):
@@ -427,7 +522,12 @@ class Rect(tuple, metaclass=MetaRect):
         Takes a pair of offsets (horizontal, vertical) and returns
         Rect((left+horizontal, top+vertical, right+horizontal, bottom+vertical)).
         """
-        return type(self)(p + d for p, d in zip(self, tuple(offsets) * 2))
+        if not self:
+            return self
+        dx, dy = offsets
+        return type(self)._make(
+            self[X0] + dx, self[Y0] + dy, self[X1] + dx, self[Y1] + dy
+        )
 
     def __or__(self, other):
         """
@@ -441,7 +541,24 @@ class Rect(tuple, metaclass=MetaRect):
 
         r1 | r2 | ... | rn is equivalent to Rect.bounding_box(r1, r2, ..., rn).
         """
-        return self.bounding_box(self, other)
+        cls = type(self)
+        if not isinstance(other, Rect):
+            other = cls(other)
+        if not other:
+            return self
+        if not self:
+            return cls(other)
+        a0, a1, a2, a3 = self
+        b0, b1, b2, b3 = other
+        return tuple_new(
+            cls,
+            (
+                a0 if a0 <= b0 else b0,
+                a1 if a1 <= b1 else b1,
+                a2 if a2 >= b2 else b2,
+                a3 if a3 >= b3 else b3,
+            ),
+        )
 
     __ror__ = __or__
 
@@ -456,49 +573,74 @@ class Rect(tuple, metaclass=MetaRect):
 
         r1 & r2 & ... & rn is equivalent to Rect.ntersection(r1, r2, ..., rn).
         """
-        return self.intersection(self, other)
+        cls = type(self)
+        if not isinstance(other, Rect):
+            other = cls(other)
+        if not self or not other:
+            return cls.EMPTY
+        a0, a1, a2, a3 = self
+        b0, b1, b2, b3 = other
+        x0 = a0 if a0 >= b0 else b0
+        y0 = a1 if a1 >= b1 else b1
+        x1 = a2 if a2 <= b2 else b2
+        y1 = a3 if a3 <= b3 else b3
+        if x0 <= x1 and y0 <= y1:
+            return tuple_new(cls, (x0, y0, x1, y1))
+        return cls.EMPTY
 
     __rand__ = __and__
 
-    def __eq__(self, other):
-        """
-        Return True if self and other are rectangles with same coordinates,
-        otherwise return False.
-        """
-        return isinstance(other, tuple) and tuple(self) == other
-
-    def __ne__(self, other):
-        """
-        Return True if self and other are rectangles with different
-        coordinates, otherwise return False.
-        """
-        return not isinstance(other, tuple) or tuple(self) != other
+    # tuple's C-level comparisons already do the right thing: coordinates
+    # are compared elementwise against any tuple, and non-tuples yield
+    # NotImplemented, which Python resolves to unequal.
+    __eq__ = tuple.__eq__
+    __ne__ = tuple.__ne__
 
     def __le__(self, other):
         """
         Return True if other contains self, otherwise return False.
         """
-        return self == self.intersection(self, other)
+        if not self:
+            return True
+        if not other:
+            return False
+        return (
+            len(other) == 4
+            and other[X0] <= self[X0]
+            and other[Y0] <= self[Y0]
+            and self[X1] <= other[X1]
+            and self[Y1] <= other[Y1]
+        )
 
     def __ge__(self, other):
         """
         Return True if self contains other, otherwise return False.
         """
-        return self == self.bounding_box(self, other)
+        if not other:
+            return True
+        if not self:
+            return False
+        return (
+            len(other) == 4
+            and self[X0] <= other[X0]
+            and self[Y0] <= other[Y0]
+            and other[X1] <= self[X1]
+            and other[Y1] <= self[Y1]
+        )
 
     def __lt__(self, other):
         """
         Return True if other contains, but is not equal to self, otherwise
         return False.
         """
-        return other != self == self.intersection(self, other)
+        return self != other and self.__le__(other)
 
     def __gt__(self, other):
         """
         Return True if self contains, but is not equal to other, otherwise
         return False.
         """
-        return other != self == self.bounding_box(self, other)
+        return self != other and self.__ge__(other)
 
     def __mul__(self, scalar):
         """
@@ -506,7 +648,11 @@ class Rect(tuple, metaclass=MetaRect):
 
         scalar must be a number.
         """
-        return type(self)(value * scalar for value in self)
+        if not self:
+            return self
+        return type(self)._make(
+            self[X0] * scalar, self[Y0] * scalar, self[X1] * scalar, self[Y1] * scalar
+        )
 
     __rmul__ = __mul__
 
@@ -514,20 +660,165 @@ class Rect(tuple, metaclass=MetaRect):
         """
         x.__str__() <==> str(x)
         """
-        return str(tuple(self))
+        return tuple.__repr__(self)
 
     def __repr__(self):
         """
         x.__repr__() <==> repr(x)
         """
-        return "{0}({1})".format(type(self).__name__, self)
+        return "{0}({1})".format(type(self).__name__, tuple.__repr__(self))
 
     __hash__ = tuple.__hash__  # classes that derive from a hashable class but
     # override __eq__ must also define __hash__ to
     # be hashable.
 
 
-def _connected_components(rects):
+# __init_subclass__ does not run for Rect itself, so its identity
+# elements are attached right after the class is created.
+Rect.EMPTY = tuple_new(Rect)
+Rect.PLANE = tuple_new(Rect, (-inf, -inf, inf, inf))
+
+
+class RectArray:
+    """
+    A columnar collection of rectangles for bulk workflows.
+
+    The coordinates of n rectangles are stored as one contiguous (n, 4)
+    float64 array instead of n tuples of boxed numbers, so aggregations
+    over many rectangles run as vectorized C loops and the whole
+    collection costs 32 bytes per rectangle.
+
+    rects may be an iterable of boxes or an array-like of shape (n, 4).
+    Empty and degenerate boxes equal Rect.EMPTY and are dropped on
+    construction.
+    Individual rectangles are materialized as Rect objects on access.
+    """
+
+    __slots__ = ("arr",)
+
+    def __init__(self, rects):
+        if isinstance(rects, np.ndarray):
+            arr = np.ascontiguousarray(rects, dtype=np.float64).reshape(-1, 4)
+            arr = arr[(arr[:, X0] <= arr[:, X1]) & (arr[:, Y0] <= arr[:, Y1])]
+        else:
+            rects = [rect for rect in map(Rect, rects) if rect]
+            arr = np.ascontiguousarray(rects, dtype=np.float64).reshape(-1, 4)
+        self.arr = arr
+
+    def __len__(self):
+        return len(self.arr)
+
+    def __iter__(self):
+        for row in self.arr.tolist():
+            yield Rect(row)
+
+    def __getitem__(self, index):
+        return Rect(self.arr[index])
+
+    def __repr__(self):
+        """
+        x.__repr__() <==> repr(x)
+        """
+        return "{0}({1})".format(type(self).__name__, self.arr.tolist())
+
+    def bounding_box(self):
+        """
+        Return the smallest Rect that contains all rectangles, or
+        Rect.EMPTY, if the collection is empty.
+        """
+        arr = self.arr
+        if not len(arr):
+            return Rect.EMPTY
+        return tuple_new(
+            Rect,
+            (
+                arr[:, X0].min().item(),
+                arr[:, Y0].min().item(),
+                arr[:, X1].max().item(),
+                arr[:, Y1].max().item(),
+            ),
+        )
+
+    def intersection(self):
+        """
+        Return the greatest Rect that is contained in all rectangles, or
+        Rect.PLANE, if the collection is empty.
+        """
+        arr = self.arr
+        if not len(arr):
+            return Rect.PLANE
+        return Rect(
+            (
+                arr[:, X0].max().item(),
+                arr[:, Y0].max().item(),
+                arr[:, X1].min().item(),
+                arr[:, Y1].min().item(),
+            )
+        )
+
+    def intersects(self, rect):
+        """
+        Return a boolean array that marks the rectangles intersecting
+        rect.
+        """
+        arr = self.arr
+        if not rect:
+            return np.zeros(len(arr), dtype=bool)
+        x0, y0, x1, y1 = rect
+        return (
+            (arr[:, X0] <= x1)
+            & (x0 <= arr[:, X1])
+            & (arr[:, Y0] <= y1)
+            & (y0 <= arr[:, Y1])
+        )
+
+    def contains(self, rect):
+        """
+        Return a boolean array that marks the rectangles containing
+        rect.
+        """
+        arr = self.arr
+        if not rect:
+            return np.ones(len(arr), dtype=bool)
+        x0, y0, x1, y1 = rect
+        return (
+            (arr[:, X0] <= x0)
+            & (arr[:, Y0] <= y0)
+            & (x1 <= arr[:, X1])
+            & (y1 <= arr[:, Y1])
+        )
+
+    def bounding_boxes(self):
+        """
+        Join each distinct set of transitively intersecting rectangles
+        into a bounding box, as Rect.bounding_boxes does.
+        """
+        return Rect.bounding_boxes(self)
+
+
+def _sweep_edges(arr):
+    # Sweep a vertical line over the rects in ascending x0 order.  The
+    # active set - rects whose x-span still reaches the sweep line - is
+    # kept as an integer index array, so both the eviction of passed
+    # rects and the y-overlap test against all active rects run as
+    # vectorized comparisons instead of per-pair interpreter work.
+    # Eviction keeps rects with x1 >= x0[i], so touching rectangles
+    # count as intersecting.
+    x1 = arr[:, X1]
+    y0 = arr[:, Y0]
+    y1 = arr[:, Y1]
+    active = np.empty(0, dtype=np.intp)
+    edges = []
+    for i in np.argsort(arr[:, X0], kind="stable").tolist():
+        active = active[x1[active] >= arr[i, X0]]
+        hits = active[(y0[active] <= y1[i]) & (y0[i] <= y1[active])]
+        for j in hits.tolist():
+            edges.append((i, j))
+        active = np.append(active, i)
+    return edges
+
+
+def _connected_components(rects, unique=False):
     # This is the well known connected components algorithm.
     # It works here because we view intersecting rectangles as
     # connected nodes in a graph.
@@ -535,37 +826,66 @@ def _connected_components(rects):
     # As Alan Kay puts it: point of view is worth 80 IQ points.
 
     # EMPTY intersects with any other rect.
-    # Equal rects intersect each other trivially.
-    rects = frozenset(filter(None, rects))
-
-    # Helper class for ITree:
-    @dataclass(eq=True, frozen=True, slots=True)
-    class Interval:
-        rect: Rect
-        start: Real
-        end: Real
-
-    # Collect intersecting rects into adjacency sets by intersecting
-    # search results from a horizontal and a vertical Interval Tree:
-    htree = ITree(Interval(rect, *horizontal(rect)) for rect in rects)
-    vtree = ITree(Interval(rect, *vertical(rect)) for rect in rects)
-    neighbors = {}
-    for rect in rects:
-        neighbors[rect] = frozenset(
-            {i.rect for i in htree.search(Interval(rect, *horizontal(rect)))}
-            & {i.rect for i in vtree.search(Interval(rect, *vertical(rect)))}
+    # Equal rects intersect each other trivially, so duplicates are
+    # dropped up front - unless the caller vouches for their absence,
+    # which saves hashing every rect.  A dict keeps the caller's order.
+    if unique:
+        rects = [rect for rect in rects if rect]
+    else:
+        rects = list(dict.fromkeys(rect for rect in rects if rect))
+    if not rects:
+        return
+
+    # One columnar (n, 4) array of coordinates instead of per-rect
+    # interval objects; the sweep and the edge list only ever see
+    # integer indices into rects.  The dtype is inferred, so integer
+    # workloads stay integral and their reductions run twice as many
+    # SIMD lanes as float64 would.
+    arr = np.asarray(rects)
+    n = len(rects)
+    indices = range(n)
+
+    if n <= BRUTE:
+        # All-pairs overlap test as four broadcasted comparisons; the
+        # upper triangle of the resulting bool matrix is the edge list.
+        overlap = (
+            (arr[:, None, X0] <= arr[None, :, X1])
+            & (arr[None, :, X0] <= arr[:, None, X1])
+            & (arr[:, None, Y0] <= arr[None, :, Y1])
+            & (arr[None, :, Y0] <= arr[:, None, Y1])
         )
-
-    # Join adjacency sets into connected components:
-    def component(node):
-        todo = set([node])
-        while todo:
-            node = todo.pop()
-            seen.add(node)
-            todo |= neighbors[node] - seen
-            yield node
-
-    seen = set()
-    for node in neighbors:
-        if node not in seen:
-            yield set(component(node))
+        edges = np.argwhere(np.triu(overlap, 1)).tolist()
+    else:
+        edges = _sweep_edges(arr)
+
+    # Join the intersection edges into connected components with a
+    # union-find (path compression + union by rank) over the integer
+    # indices.  This runs in O((n + k)·α(n)) and allocates no
+    # per-component sets.
+    parent = list(indices)
+    rank = [0] * n
+
+    def find(x):
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    for i, j in edges:
+        ri = find(i)
+        rj = find(j)
+        if ri != rj:
+            if rank[ri] < rank[rj]:
+                ri, rj = rj, ri
+            parent[rj] = ri
+            if rank[ri] == rank[rj]:
+                rank[ri] += 1
+
+    # Bucket the indices by their component's root:
+    components = {}
+    for i in indices:
+        components.setdefault(find(i), []).append(i)
+    for group in components.values():
+        yield {rects[i] for i in group}
@@ -0,0 +1,24 @@
+"""Scaling benchmarks for Rect.bounding_boxes.
+
+A scaled-up version of the clustered case at the end of the enclosure
+tests: each cluster is a chain of overlapping rects, and clusters are
+placed far apart so the result has one box per cluster. Disabled in the
+default test run; enable with:
+
+    pytest --benchmark-enable --benchmark-only
+"""
+
+import pytest
+
+from pyraxial import Rect
+
+
+@pytest.mark.parametrize("n_clusters, cluster_size", [(10, 10), (100, 10), (1000, 10)])
+def test_bounding_boxes_scaling(benchmark, n_clusters, cluster_size):
+    rects = []
+    for k in range(n_clusters):
+        base = k * 1000
+        for i in range(cluster_size):
+            rects.append(Rect((base + i, base + i, base + i + 2, base + i + 2)))
+    result = benchmark(lambda: list(Rect.bounding_boxes(rects)))
+    assert len(result) == n_clusters
@@ -1,101 +1,152 @@
+import operator
+
+import numpy as np
 import pytest
 
-from pyraxial import Rect
+from functools import lru_cache
+from itertools import product
 
+import pyraxial
+from pyraxial import Rect, RectArray
 
-def assert_if(a, b):
-    if a:
-        assert b
 
+@lru_cache(maxsize=None)
+def rect(*coords):
+    """Return a cached Rect for coords; Rect is immutable, so sharing is safe."""
+    return Rect(coords)
 
-def assert_raises(error, test):
-    with pytest.raises(error):
-        test()
 
+EMPTY = Rect.EMPTY
+PLANE = Rect.PLANE
+RECTS = (
+    EMPTY,
+    PLANE,
+    rect(1, 2, 3, 4),
+    rect(2, 3, 4, 5),
+    rect(6, 7, 8, 9),
+)
+MORE_RECTS = RECTS + (rect(1, 1, 9, 9), rect(0, 0, 10, 10))
+PAIRS = tuple(product(RECTS, repeat=2))
+TRIPLES = tuple(product(RECTS, repeat=3))
+MORE_PAIRS = tuple(product(MORE_RECTS, repeat=2))
+MORE_TRIPLES = tuple(product(MORE_RECTS, repeat=3))
+EMPTY_TUPLE = tuple(EMPTY)
+PLANE_TUPLE = tuple(PLANE)
 
-def test_starimport():
-    import pyraxial
 
-    assert set(pyraxial.__all__) == set(["Rect"])
+def test_starimport():
+    assert set(pyraxial.__all__) == {"Rect", "RectArray"}
 
 
 def test_new():
     a = Rect((1, 2, 3, 4))
-    assert Rect.EMPTY == Rect(())
-    assert Rect.EMPTY == Rect([])
-    assert Rect.EMPTY == Rect(iter(()))
-    assert Rect.EMPTY == Rect(Rect.EMPTY)
-    assert a == Rect((1, 2, 3, 4))
-    assert a == Rect([1, 2, 3, 4])
-    assert a == Rect(iter((1, 2, 3, 4)))
-    assert a == Rect(a)
-    assert_raises(TypeError, lambda: Rect(1, 2, 3, 4))
-    assert_raises(ValueError, lambda: Rect(1))
-    assert_raises(ValueError, lambda: Rect((1, 2, 3)))
-    assert_raises(ValueError, lambda: Rect(iter((1, 2, 3))))
-    assert_raises(ValueError, lambda: Rect((1, 2, 3, 4, 5)))
-    assert_raises(ValueError, lambda: Rect(iter((1, 2, 3, 4, 5))))
+    for coerce in tuple, list, iter, Rect:
+        assert EMPTY == Rect(coerce(()))
+        assert a == Rect(coerce((1, 2, 3, 4)))
+    with pytest.raises(TypeError):
+        Rect(1, 2, 3, 4)
+    with pytest.raises(ValueError):
+        Rect(1)
+    with pytest.raises(ValueError):
+        Rect((1, 2, 3))
+    with pytest.raises(ValueError):
+        Rect(iter((1, 2, 3)))
+    with pytest.raises(ValueError):
+        Rect((1, 2, 3, 4, 5))
+    with pytest.raises(ValueError):
+        Rect(iter((1, 2, 3, 4, 5)))
 
 
 def test_from_size():
-    assert Rect.from_size((1, 2)) == Rect((0, 0, 1, 2))
+    assert Rect.from_size((1, 2)) == rect(0, 0, 1, 2)
 
 
 def test_from_points():
     p = 1, 2
     q = 3, 4
-    r = Rect((1, 2, 3, 4))
+    r = rect(1, 2, 3, 4)
     assert Rect.from_points(p, q) == r
 
 
-def test_properties():
-    assert_raises(IndexError, lambda: Rect.EMPTY.left)
-    assert_raises(IndexError, lambda: Rect.EMPTY.top)
-    assert_raises(IndexError, lambda: Rect.EMPTY.right)
-    assert_raises(IndexError, lambda: Rect.EMPTY.bottom)
-    assert_raises(IndexError, lambda: Rect.EMPTY.left_top)
-    assert_raises(IndexError, lambda: Rect.EMPTY.right_top)
-    assert_raises(IndexError, lambda: Rect.EMPTY.left_bottom)
-    assert_raises(IndexError, lambda: Rect.EMPTY.right_bottom)
-    assert_raises(IndexError, lambda: Rect.EMPTY.width)
-    assert_raises(IndexError, lambda: Rect.EMPTY.height)
-    assert_raises(IndexError, lambda: Rect.EMPTY.points)
-    assert_raises(IndexError, lambda: Rect.EMPTY.size)
-    assert_raises(IndexError, lambda: Rect.EMPTY.area)
-    rects = (1, 2, 3, 4), (-4, -3, -2, -1), (-2, -1, 1, 2), (0, 0, 0, 0)
-    for left, top, right, bottom in rects:
-        a = Rect((left, top, right, bottom))
-        assert a.left == left
-        assert a.top == top
-        assert a.right == right
-        assert a.bottom == bottom
-        assert a.left_top == (left, top)
-        assert a.right_top == (right, top)
-        assert a.left_bottom == (left, bottom)
-        assert a.right_bottom == (right, bottom)
-        assert a.width == abs(right - left)
-        assert a.height == abs(bottom - top)
-        assert a.points == ((left, top), (right, bottom))
-        assert a.size == (abs(right - left), abs(bottom - top))
-        assert a.area == abs((right - left) * (bottom - top))
+ATTRS = (
+    "left",
+    "top",
+    "right",
+    "bottom",
+    "left_top",
+    "right_top",
+    "left_bottom",
+    "right_bottom",
+    "width",
+    "height",
+    "points",
+    "size",
+    "area",
+)
+
+
+@pytest.mark.parametrize("attr", ATTRS)
+def test_empty_properties_raise(attr):
+    with pytest.raises(IndexError):
+        getattr(EMPTY, attr)
+
+
+@pytest.mark.parametrize(
+    "left, top, right, bottom",
+    [(1, 2, 3, 4), (-4, -3, -2, -1), (-2, -1, 1, 2), (0, 0, 0, 0)],
+)
+def test_properties(left, top, right, bottom):
+    a = Rect((left, top, right, bottom))
+    width = abs(right - left)
+    height = abs(bottom - top)
+    got = (
+        a.left,
+        a.top,
+        a.right,
+        a.bottom,
+        a.left_top,
+        a.right_top,
+        a.left_bottom,
+        a.right_bottom,
+        a.width,
+        a.height,
+        a.points,
+        a.size,
+        a.area,
+    )
+    expected = (
+        left,
+        top,
+        right,
+        bottom,
+        (left, top),
+        (right, top),
+        (left, bottom),
+        (right, bottom),
+        width,
+        height,
+        ((left, top), (right, bottom)),
+        (width, height),
+        width * height,
+    )
+    assert got == expected
 
 
 def test_move():
-    s = Rect((1, 2, 3, 4))
-    t = Rect((2, 4, 4, 6))
+    s = rect(1, 2, 3, 4)
+    t = rect(2, 4, 4, 6)
     d = 1, 2
     assert s.move(d) == t
-    assert Rect.EMPTY.move(d) == Rect.EMPTY
-    assert Rect.PLANE.move(d) == Rect.PLANE
+    assert EMPTY.move(d) == EMPTY
+    assert PLANE.move(d) == PLANE
 
 
 def test_eq():
-    boxes = ((1, 2, 3, 4), (2, 3, 4, 5), (6, 7, 8, 9), (), [], Rect.EMPTY, Rect.PLANE)
-    from itertools import product
-
-    for a, b in product(boxes, repeat=2):
-        assert (tuple(a) == tuple(b)) == (Rect(a) == Rect(b))
-        assert (tuple(a) == Rect(b)) == (Rect(a) == tuple(b))
+    boxes = ((1, 2, 3, 4), (2, 3, 4, 5), (6, 7, 8, 9), (), [], EMPTY, PLANE)
+    pairs = [(Rect(a), Rect(b), tuple(a), tuple(b)) for a, b in product(boxes, repeat=2)]
+    for ra, rb, ta, tb in pairs:
+        assert (ta == tb) == (ra == rb)
+        assert (ta == rb) == (ra == tb)
 
 
 def test_ne():
@@ -105,466 +156,453 @@ def test_ne():
         (6, 7, 8, 9),
         (),
         [],
-        tuple(Rect.EMPTY),
-        tuple(Rect.PLANE),
+        EMPTY_TUPLE,
+        PLANE_TUPLE,
     )
-    from itertools import product
-
-    for a, b in product(boxes, repeat=2):
-        assert (tuple(a) != tuple(b)) == (Rect(a) != Rect(b))
-        assert (tuple(a) != Rect(b)) == (Rect(a) != tuple(b))
-
-
-def test_le():
-    a = Rect((1, 2, 3, 4))
-    b = Rect((1, 1, 4, 4))
-    z = Rect.EMPTY
-    u = Rect.PLANE
+    pairs = [(Rect(a), Rect(b), tuple(a), tuple(b)) for a, b in product(boxes, repeat=2)]
+    for ra, rb, ta, tb in pairs:
+        assert (ta != tb) == (ra != rb)
+        assert (ta != rb) == (ra != tb)
+
+
+@pytest.mark.parametrize(
+    "op, flipped, strict",
+    [
+        (operator.le, False, False),
+        (operator.ge, True, False),
+        (operator.lt, False, True),
+        (operator.gt, True, True),
+    ],
+)
+def test_order(op, flipped, strict):
+    a = rect(1, 2, 3, 4)
+    b = rect(1, 1, 4, 4)
+    z = EMPTY
+    u = PLANE
     for x in a, b, z, u:
-        assert x <= x
-        assert tuple(x) <= x
-        assert x <= tuple(x)
+        tx = tuple(x)
+        assert op(x, x) != strict
+        assert op(tx, x) != strict
+        assert op(x, tx) != strict
     for x, y in (z, a), (z, b), (a, u), (b, u), (a, b), (z, u):
-        assert x <= y
-        assert tuple(x) <= y
-        assert x <= tuple(y)
-        assert not y <= x
-        assert not tuple(y) <= x
-        assert not y <= tuple(x)
-
-
-def test_ge():
-    a = Rect((1, 2, 3, 4))
-    b = Rect((1, 1, 4, 4))
-    z = Rect.EMPTY
-    u = Rect.PLANE
-    for x in a, b, z, u:
-        assert x >= x
-        assert tuple(x) >= x
-        assert x >= tuple(x)
-    for x, y in (a, z), (b, z), (u, a), (u, b), (b, a), (u, z):
-        assert x >= y
-        assert tuple(x) >= y
-        assert x >= tuple(y)
-        assert not y >= x
-        assert not tuple(y) >= x
-        assert not y >= tuple(x)
-
-
-def test_lt():
-    a = Rect((1, 2, 3, 4))
-    b = Rect((1, 1, 4, 4))
-    z = Rect.EMPTY
-    u = Rect.PLANE
-    for x in a, b, z, u:
-        assert not x < x
-        assert not tuple(x) < x
-        assert not x < tuple(x)
-    for x, y in (z, a), (z, b), (a, u), (b, u), (a, b), (z, u):
-        assert x < y
-        assert tuple(x) < y
-        assert x < tuple(y)
-        assert not y < x
-        assert not tuple(y) < x
-        assert not y < tuple(x)
-
-
-def test_gt():
-    a = Rect((1, 2, 3, 4))
-    b = Rect((1, 1, 4, 4))
-    z = Rect.EMPTY
-    u = Rect.PLANE
-    for x in a, b, z, u:
-        assert not x > x
-        assert not tuple(x) > x
-        assert not x > tuple(x)
-    for x, y in (a, z), (b, z), (u, a), (u, b), (b, a), (u, z):
-        assert x > y
-        assert tuple(x) > y
-        assert x > tuple(y)
-        assert not y > x
-        assert not tuple(y) > x
-        assert not y > tuple(x)
-
-
-def test_or():
-    def test(a, b, c):
-        assert (a | b) == c
-        assert (a | tuple(b)) == c
-        assert (tuple(a) | b) == c
-        assert (a | list(b)) == c
-        assert (list(a) | b) == c
-
-    test(Rect((1, 1, 2, 2)), Rect((1, 1, 2, 2)), Rect((1, 1, 2, 2)))
-    test(Rect((1, 1, 3, 3)), Rect((2, 2, 4, 4)), Rect((1, 1, 4, 4)))
-    test(Rect((1, 1, 2, 2)), Rect((3, 3, 4, 4)), Rect((1, 1, 4, 4)))
-    test(Rect((1, 1, 2, 2)), Rect((2, 2, 3, 3)), Rect((1, 1, 3, 3)))
-    test(Rect((1, 1, 2, 2)), Rect.EMPTY, Rect((1, 1, 2, 2)))
-    test(Rect.EMPTY, Rect((1, 1, 2, 2)), Rect((1, 1, 2, 2)))
-    test(Rect.EMPTY, Rect.EMPTY, Rect.EMPTY)
-
-
-def test_and():
-    def test(a, b, c):
-        assert (a & b) == c
-        assert (a & tuple(b)) == c
-        assert (tuple(a) & b) == c
-        assert (a & list(b)) == c
-        assert (list(a) & b) == c
-
-    test(Rect((1, 1, 2, 2)), Rect((1, 1, 2, 2)), Rect((1, 1, 2, 2)))
-    test(Rect((1, 1, 3, 3)), Rect((2, 2, 4, 4)), Rect((2, 2, 3, 3)))
-    test(Rect((1, 1, 2, 2)), Rect((3, 3, 4, 4)), Rect.EMPTY)
-    test(Rect((1, 1, 2, 2)), Rect((2, 2, 3, 3)), Rect((2, 2, 2, 2)))
-    test(Rect((1, 1, 2, 2)), Rect.EMPTY, Rect.EMPTY)
-    test(Rect.EMPTY, Rect((1, 1, 2, 2)), Rect.EMPTY)
-    test(Rect.EMPTY, Rect.EMPTY, Rect.EMPTY)
+        if flipped:
+            x, y = y, x
+        tx, ty = tuple(x), tuple(y)
+        assert op(x, y)
+        assert op(tx, y)
+        assert op(x, ty)
+        assert not op(y, x)
+        assert not op(ty, x)
+        assert not op(y, tx)
+
+
+COERCER_PAIRS = (
+    (Rect, Rect),
+    (Rect, tuple),
+    (tuple, Rect),
+    (Rect, list),
+    (list, Rect),
+)
+
+OR_CASES = [
+    (rect(1, 1, 2, 2), rect(1, 1, 2, 2), rect(1, 1, 2, 2)),
+    (rect(1, 1, 3, 3), rect(2, 2, 4, 4), rect(1, 1, 4, 4)),
+    (rect(1, 1, 2, 2), rect(3, 3, 4, 4), rect(1, 1, 4, 4)),
+    (rect(1, 1, 2, 2), rect(2, 2, 3, 3), rect(1, 1, 3, 3)),
+    (rect(1, 1, 2, 2), EMPTY, rect(1, 1, 2, 2)),
+    (EMPTY, rect(1, 1, 2, 2), rect(1, 1, 2, 2)),
+    (EMPTY, EMPTY, EMPTY),
+]
+
+AND_CASES = [
+    (rect(1, 1, 2, 2), rect(1, 1, 2, 2), rect(1, 1, 2, 2)),
+    (rect(1, 1, 3, 3), rect(2, 2, 4, 4), rect(2, 2, 3, 3)),
+    (rect(1, 1, 2, 2), rect(3, 3, 4, 4), EMPTY),
+    (rect(1, 1, 2, 2), rect(2, 2, 3, 3), rect(2, 2, 2, 2)),
+    (rect(1, 1, 2, 2), EMPTY, EMPTY),
+    (EMPTY, rect(1, 1, 2, 2), EMPTY),
+    (EMPTY, EMPTY, EMPTY),
+]
+
+
+@pytest.mark.parametrize("a, b, c", OR_CASES)
+def test_or(a, b, c):
+    for fa, fb in COERCER_PAIRS:
+        assert (fa(a) | fb(b)) == c
+
+
+@pytest.mark.parametrize("a, b, c", AND_CASES)
+def test_and(a, b, c):
+    for fa, fb in COERCER_PAIRS:
+        assert (fa(a) & fb(b)) == c
 
 
 def test_mul():
-    a = Rect((1, 2, 3, 4))
-    b = Rect((2, 4, 6, 8))
-    assert (Rect.EMPTY * 2) == Rect.EMPTY
-    assert (2 * Rect.EMPTY) == Rect.EMPTY
-    assert (a * 2) == b
-    assert (2 * a) == b
+    a = rect(1, 2, 3, 4)
+    b = rect(2, 4, 6, 8)
+    assert (EMPTY * 2, 2 * EMPTY, a * 2, 2 * a) == (
+        EMPTY,
+        EMPTY,
+        b,
+        b,
+    )
 
 
 def test_repr():
-    assert repr(Rect.EMPTY) == "Rect(())"
-    assert repr(Rect.PLANE) == "Rect((-inf, -inf, inf, inf))"
-    assert repr(Rect((1, 2, 3, 4))) == "Rect((1, 2, 3, 4))"
+    assert (repr(EMPTY), repr(PLANE), repr(Rect((1, 2, 3, 4)))) == (
+        "Rect(())",
+        "Rect((-inf, -inf, inf, inf))",
+        "Rect((1, 2, 3, 4))",
+    )
 
 
 def test_str():
-    assert str(Rect.EMPTY) == "()"
-    assert str(Rect.PLANE) == "(-inf, -inf, inf, inf)"
-    assert str(Rect((1, 2, 3, 4))) == "(1, 2, 3, 4)"
+    assert (str(EMPTY), str(PLANE), str(Rect((1, 2, 3, 4)))) == (
+        "()",
+        "(-inf, -inf, inf, inf)",
+        "(1, 2, 3, 4)",
+    )
 
 
 def test_identity_elements():
-    for a in Rect.EMPTY, Rect.PLANE, Rect((1, 2, 3, 4)):
-        assert (a | Rect.EMPTY) == a
-        assert (a & Rect.PLANE) == a
+    for a in EMPTY, PLANE, rect(1, 2, 3, 4):
+        assert (a | EMPTY) == a
+        assert (a & PLANE) == a
 
 
 def test_absorbing_elements():
-    for a in (Rect.EMPTY, Rect.PLANE, Rect((1, 2, 3, 4))):
-        assert (a | Rect.PLANE) == Rect.PLANE
-        assert (a & Rect.EMPTY) == Rect.EMPTY
+    for a in (EMPTY, PLANE, rect(1, 2, 3, 4)):
+        assert (a | PLANE) == PLANE
+        assert (a & EMPTY) == EMPTY
 
 
 def test_bounding_box():
-    from itertools import permutations
-
-    a = Rect((1, 2, 3, 4))
-    assert Rect.bounding_box() == Rect.EMPTY
-    assert Rect.bounding_box(Rect.EMPTY) == Rect.EMPTY
-    assert Rect.bounding_box(Rect.EMPTY, Rect.EMPTY) == Rect.EMPTY
+    a = rect(1, 2, 3, 4)
+    assert Rect.bounding_box() == EMPTY
+    assert Rect.bounding_box(EMPTY) == EMPTY
+    assert Rect.bounding_box(EMPTY, EMPTY) == EMPTY
     assert Rect.bounding_box(a) == a
     assert Rect.bounding_box(a, a) == a
-    assert Rect.bounding_box(a, Rect.EMPTY) == a
-    assert Rect.bounding_box(Rect.EMPTY, a) == a
-    rects = (Rect.EMPTY, Rect((1, 2, 3, 4)), Rect((2, 3, 4, 5)), Rect((6, 7, 8, 9)))
-    expected = Rect((1, 2, 8, 9))
-    for a, b, c, d in permutations(rects):
+    assert Rect.bounding_box(a, EMPTY) == a
+    assert Rect.bounding_box(EMPTY, a) == a
+    rects = (EMPTY, rect(1, 2, 3, 4), rect(2, 3, 4, 5), rect(6, 7, 8, 9))
+    expected = rect(1, 2, 8, 9)
+    # bounding_box is commutative, so a few argument orders suffice.
+    for a, b, c, d in rects, rects[::-1], (rects[2], rects[0], rects[3], rects[1]):
         assert Rect.bounding_box(a, b, c, d) == expected
 
 
 def test_intersection():
-    a = Rect((1, 2, 3, 4))
-    b = Rect((2, 3, 4, 5))
-    c = Rect((2, 3, 3, 4))
-    d = Rect((5, 6, 7, 8))
-    assert Rect.intersection() == Rect.PLANE
-    assert Rect.intersection(Rect.EMPTY) == Rect.EMPTY
-    assert Rect.intersection(Rect.EMPTY, Rect.EMPTY) == Rect.EMPTY
+    a = rect(1, 2, 3, 4)
+    b = rect(2, 3, 4, 5)
+    c = rect(2, 3, 3, 4)
+    d = rect(5, 6, 7, 8)
+    assert Rect.intersection() == PLANE
+    assert Rect.intersection(EMPTY) == EMPTY
+    assert Rect.intersection(EMPTY, EMPTY) == EMPTY
     assert Rect.intersection(a) == a
     assert Rect.intersection(a, a) == a
-    assert Rect.intersection(a, Rect.EMPTY) == Rect.EMPTY
-    assert Rect.intersection(Rect.EMPTY, a) == Rect.EMPTY
+    assert Rect.intersection(a, EMPTY) == EMPTY
+    assert Rect.intersection(EMPTY, a) == EMPTY
     assert Rect.intersection(a, b) == c
     assert Rect.intersection(b, a) == c
-    assert Rect.intersection(a, d) == Rect.EMPTY
-    assert Rect.intersection(d, a) == Rect.EMPTY
+    assert Rect.intersection(a, d) == EMPTY
+    assert Rect.intersection(d, a) == EMPTY
+    assert Rect.intersection(a, ()) == EMPTY
+
+
+def test_subclassing():
+    class Box(Rect):
+        __slots__ = ()
+
+    assert type(Box.EMPTY) is Box
+    assert type(Box.PLANE) is Box
+    assert Box(()) is Box.EMPTY
+    assert type(Box((1, 2, 3, 4)) | Box((2, 3, 4, 5))) is Box
+    assert type(Box((1, 2, 3, 4)) & Box((2, 3, 4, 5))) is Box
+
+
+def test_rect_array():
+    rects = RectArray([(1, 2, 3, 4), EMPTY, (2, 3, 4, 5), [6, 7, 8, 9]])
+    assert len(rects) == 3
+    assert list(rects) == [Rect((1, 2, 3, 4)), Rect((2, 3, 4, 5)), Rect((6, 7, 8, 9))]
+    assert rects[0] == Rect((1, 2, 3, 4))
+    assert rects.bounding_box() == Rect((1, 2, 8, 9))
+    assert rects.intersection() == EMPTY
+    assert RectArray([(1, 2, 3, 4), (2, 3, 4, 5)]).intersection() == Rect((2, 3, 3, 4))
+    assert list(rects.intersects(Rect((3, 4, 4, 5)))) == [True, True, False]
+    assert list(rects.intersects(EMPTY)) == [False, False, False]
+    assert list(rects.contains(Rect((2, 3, 3, 4)))) == [True, True, False]
+    assert list(rects.contains(EMPTY)) == [True, True, True]
+    assert set(rects.bounding_boxes()) == set([Rect((1, 2, 4, 5)), Rect((6, 7, 8, 9))])
+    assert len(RectArray([(5, 5, 0, 0)])) == 0
+    assert RectArray([(5, 5, 0, 0)]).bounding_box() == EMPTY
+    degenerate = np.array([[5.0, 5.0, 0.0, 0.0], [1.0, 2.0, 3.0, 4.0]])
+    assert list(RectArray(degenerate)) == [Rect((1, 2, 3, 4))]
+    assert RectArray(degenerate[:1]).bounding_box() == EMPTY
+    assert len(RectArray([])) == 0
+    assert RectArray([]).bounding_box() == EMPTY
+    assert RectArray([]).intersection() == PLANE
+    assert repr(RectArray([(1, 2, 3, 4)])) == "RectArray([[1.0, 2.0, 3.0, 4.0]])"
+
+
+def test_many_rects():
+    rects = [Rect((i, i + 1, i + 2, i + 3)) for i in range(40)]
+    assert Rect.bounding_box(*rects) == Rect((0, 1, 41, 42))
+    assert Rect.intersection(*rects) == EMPTY
+    assert Rect.intersection(*40 * [Rect((1, 2, 3, 4))]) == Rect((1, 2, 3, 4))
+    # Coordinates NumPy cannot represent fall back to the Python loop.
+    big = 10**30
+    huge = [Rect((big + i, 0, big + i + 1, 1)) for i in range(40)]
+    assert Rect.bounding_box(*huge) == Rect((big, 0, big + 40, 1))
+    assert Rect.intersection(*40 * [Rect((big, 0, big + 1, 1))]) == Rect((big, 0, big + 1, 1))
+
+
+def test_bounding_boxes_many():
+    # Enough rects to exercise the sweep-line code path.
+    chained = [Rect((i, 0, i + 1, 1)) for i in range(600)]
+    islands = [Rect((3 * i, 3, 3 * i + 1, 4)) for i in range(600)]
+    result = set(Rect.bounding_boxes(chained + islands))
+    assert result == set([Rect((0, 0, 600, 1))]) | set(islands)
 
 
 def test_idempotency():
-    for a in Rect.EMPTY, Rect.PLANE, Rect((1, 2, 3, 4)):
+    for a in EMPTY, PLANE, rect(1, 2, 3, 4):
         assert (a | a) == a
         assert (a & a) == a
 
 
 def test_associativity():
-    from itertools import product
-
-    rects = (
-        Rect.EMPTY,
-        Rect.PLANE,
-        Rect((1, 2, 3, 4)),
-        Rect((2, 3, 4, 5)),
-        Rect((6, 7, 8, 9)),
-    )
-    for a, b, c in product(rects, repeat=3):
+    for a, b, c in TRIPLES:
         assert ((a | b) | c) == (a | (b | c))
         assert ((a & b) & c) == (a & (b & c))
 
 
 def test_commutativity():
-    from itertools import product
-
-    rects = (
-        Rect.EMPTY,
-        Rect.PLANE,
-        Rect((1, 2, 3, 4)),
-        Rect((2, 3, 4, 5)),
-        Rect((6, 7, 8, 9)),
-    )
-    for a, b in product(rects, repeat=2):
+    for a, b in PAIRS:
         assert (a | b) == (b | a)
         assert (a & b) == (b & a)
 
 
 def test_absorbtion():
-    from itertools import product
-
-    rects = (
-        Rect.EMPTY,
-        Rect.PLANE,
-        Rect((1, 2, 3, 4)),
-        Rect((2, 3, 4, 5)),
-        Rect((6, 7, 8, 9)),
-    )
-    for a, b in product(rects, repeat=2):
+    for a, b in PAIRS:
         assert (a | (a & b)) == a
         assert (a & (a | b)) == a
 
 
-def test_least_element():
-    for a in Rect.EMPTY, Rect.PLANE, Rect((1, 2, 3, 4)):
-        assert Rect.EMPTY <= a
-        assert a >= Rect.EMPTY
-
-
-def test_greatest_element():
-    for a in Rect.EMPTY, Rect.PLANE, Rect((1, 2, 3, 4)):
-        assert a <= Rect.PLANE
-        assert Rect.PLANE >= a
-
-
-def test_reflexivity():
-    for a in Rect.EMPTY, Rect.PLANE, Rect((1, 2, 3, 4)):
+def test_lattice_order_basics():
+    for a in EMPTY, PLANE, rect(1, 2, 3, 4):
         assert a <= a
         assert a >= a
+        assert EMPTY <= a
+        assert a >= EMPTY
+        assert a <= PLANE
+        assert PLANE >= a
 
 
+@pytest.mark.slow
 def test_transitivity():
-    from itertools import product
-
-    rects = (
-        Rect.EMPTY,
-        Rect.PLANE,
-        Rect((1, 2, 3, 4)),
-        Rect((2, 3, 4, 5)),
-        Rect((6, 7, 8, 9)),
-        Rect((1, 1, 9, 9)),
-        Rect((0, 0, 10, 10)),
-    )
-    for a, b, c in product(rects, repeat=3):
-        assert_if(a <= b and b <= c, a <= c)
-        assert_if(a >= b and b >= c, a >= c)
-        assert_if(a < b and b < c, a < c)
-        assert_if(a > b and b > c, a > c)
-
-
+    for a, b, c in MORE_TRIPLES:
+        if a <= b and b <= c:
+            assert a <= c
+        if a >= b and b >= c:
+            assert a >= c
+        if a < b and b < c:
+            assert a < c
+        if a > b and b > c:
+            assert a > c
+
+
+@pytest.mark.slow
 def test_antisymmetry():
-    from itertools import product
-
-    rects = (
-        Rect.EMPTY,
-        Rect.PLANE,
-        Rect((1, 2, 3, 4)),
-        Rect((2, 3, 4, 5)),
-        Rect((6, 7, 8, 9)),
-        Rect((1, 1, 9, 9)),
-        Rect((0, 0, 10, 10)),
-    )
-    for a, b in product(rects, repeat=2):
+    for a, b in MORE_PAIRS:
         assert (a <= b and b <= a) == (a == b)
         assert (a >= b and b >= a) == (a == b)
 
 
+@pytest.mark.slow
 def test_monotonicity():
-    from itertools import product
-
-    rects = (
-        Rect.EMPTY,
-        Rect.PLANE,
-        Rect((1, 2, 3, 4)),
-        Rect((2, 3, 4, 5)),
-        Rect((6, 7, 8, 9)),
-        Rect((1, 1, 9, 9)),
-        Rect((0, 0, 10, 10)),
-    )
-    for a1, a2, b1, b2 in product(rects, repeat=4):
-        assert_if(a1 <= a2 and b1 <= b2, a1 | b1 <= a2 | b2)
-        assert_if(a1 <= a2 and b1 <= b2, a1 & b1 <= a2 & b2)
-        assert_if(a1 >= a2 and b1 >= b2, a1 | b1 >= a2 | b2)
-        assert_if(a1 >= a2 and b1 >= b2, a1 & b1 >= a2 & b2)
+    le_pairs = [(x, y) for x, y in MORE_PAIRS if x <= y]
+    for a1, a2 in le_pairs:
+        for b1, b2 in le_pairs:
+            assert a1 | b1 <= a2 | b2
+            assert a1 & b1 <= a2 & b2
+
 
+@pytest.mark.slow
+def test_monotonicity_dual():
+    ge_pairs = [(x, y) for x, y in MORE_PAIRS if x >= y]
+    for a1, a2 in ge_pairs:
+        for b1, b2 in ge_pairs:
+            assert a1 | b1 >= a2 | b2
+            assert a1 & b1 >= a2 & b2
 
+
+@pytest.mark.slow
 def test_semidistributivity():
-    from itertools import product
-
-    rects = (
-        Rect.EMPTY,
-        Rect.PLANE,
-        Rect((1, 2, 3, 4)),
-        Rect((2, 3, 4, 5)),
-        Rect((6, 7, 8, 9)),
-        Rect((1, 1, 9, 9)),
-        Rect((0, 0, 10, 10)),
-    )
-    for a, b, c in product(rects, repeat=3):
+    for a, b, c in MORE_TRIPLES:
         assert (a & (b | c)) >= ((a & b) | (a & c))
         assert (a | (b & c)) <= ((a | b) & (a | c))
 
 
-def test_enclosures():
-    from itertools import permutations
-
-    data = [
-        [
-            [  # an empty list returns an empty list.
-            ],
-            [],
-        ],
-        [
-            [  # Rect.EMPTY intersects with nothing.
-                Rect.EMPTY,
-            ],
-            [],
-        ],
-        [
-            [  # Several Rect.EMPTY also intersect with nothing.
-                Rect.EMPTY,
-                Rect.EMPTY,
-                Rect.EMPTY,
-            ],
-            [],
-        ],
-        [
-            [  # Any non-empty Rect intersects with Rect.EMPTY.
-                Rect.EMPTY,
-                [1, 1, 2, 2],
-            ],
-            [
-                [1, 1, 2, 2],
-            ],
-        ],
-        [
-            [  # Rect.PLANE intersects with Rect.PLANE.
-                Rect.PLANE,
-            ],
-            [
-                Rect.PLANE,
-            ],
-        ],
-        [
-            [  # Rect.PLANE intersects with all other Rects.
-                [1, 1, 2, 2],
-                [3, 3, 4, 4],
-                Rect.EMPTY,
-                Rect.PLANE,
-            ],
-            [
-                Rect.PLANE,
-            ],
-        ],
-        [
-            [  # Identical Rects intersect with the same area.
-                [1, 1, 2, 2],
-                [1, 1, 2, 2],
-            ],
-            [
-                [1, 1, 2, 2],
-            ],
-        ],
-        [
-            [  # Intersecting Rects intersect. Duh.
-                [1, 1, 3, 3],
-                [2, 2, 4, 4],
-            ],
-            [
-                [1, 1, 4, 4],
-            ],
-        ],
-        [
-            [  # Non-intersecting Rects don't intersect. Duh.
-                [1, 1, 2, 2],
-                [3, 3, 4, 4],
-            ],
-            [
-                [1, 1, 2, 2],
-                [3, 3, 4, 4],
-            ],
-        ],
-        [
-            [  # A completely envelopped Rect gets absorbed.
-                [1, 1, 4, 4],
-                [2, 2, 3, 3],
-            ],
-            [
-                [1, 1, 4, 4],
-            ],
-        ],
-        [
-            [  # Adjacent Rects intersect with each other.
-                [1, 1, 2, 2],
-                [2, 2, 3, 3],
-            ],
-            [
-                [1, 1, 3, 3],
-            ],
-        ],
-        [
-            [  # "Transitively" ntersecting Rects get joined into the same BBox.
-                [1, 2, 3, 4],
-                [2, 3, 4, 5],
-                [4, 5, 6, 7],
-                [5, 6, 7, 8],
-            ],
-            [
-                [1, 2, 7, 8],
-            ],
-        ],
-        [
-            [  # And so on.
-                [1, 2, 2, 3],
-                [2, 3, 3, 4],
-                [5, 6, 6, 7],
-                [6, 7, 7, 8],
-                [11, 12, 12, 13],
-                [12, 13, 13, 14],
-                [15, 16, 16, 17],
-                [16, 17, 17, 18],
-                [10, 20, 20, 30],
-                [20, 30, 30, 40],
-                [50, 60, 60, 70],
-                [60, 70, 70, 80],
-            ],
-            [
-                [1, 2, 3, 4],
-                [5, 6, 7, 8],
-                [11, 12, 13, 14],
-                [15, 16, 17, 18],
-                [10, 20, 30, 40],
-                [50, 60, 70, 80],
-            ],
-        ],
-    ]
-    for rects, expected in data:
-        rects = map(Rect, rects)
-        result = set(Rect.bounding_boxes(rects))
-        expected = set(map(Rect, expected))
-        assert result == expected
+ENCLOSURE_CASES = (
+    (
+        (  # an empty sequence yields no boxes.
+        ),
+        (),
+    ),
+    (
+        (  # Rect.EMPTY intersects with nothing.
+            EMPTY,
+        ),
+        (),
+    ),
+    (
+        (  # Several Rect.EMPTY also intersect with nothing.
+            EMPTY,
+            EMPTY,
+            EMPTY,
+        ),
+        (),
+    ),
+    (
+        (  # Any non-empty Rect intersects with Rect.EMPTY.
+            EMPTY,
+            (1, 1, 2, 2),
+        ),
+        (
+            (1, 1, 2, 2),
+        ),
+    ),
+    (
+        (  # Rect.PLANE intersects with Rect.PLANE.
+            PLANE,
+        ),
+        (
+            PLANE,
+        ),
+    ),
+    (
+        (  # Rect.PLANE intersects with all other Rects.
+            (1, 1, 2, 2),
+            (3, 3, 4, 4),
+            EMPTY,
+            PLANE,
+        ),
+        (
+            PLANE,
+        ),
+    ),
+    (
+        (  # Identical Rects intersect with the same area.
+            (1, 1, 2, 2),
+            (1, 1, 2, 2),
+        ),
+        (
+            (1, 1, 2, 2),
+        ),
+    ),
+    (
+        (  # Intersecting Rects intersect. Duh.
+            (1, 1, 3, 3),
+            (2, 2, 4, 4),
+        ),
+        (
+            (1, 1, 4, 4),
+        ),
+    ),
+    (
+        (  # Non-intersecting Rects don't intersect. Duh.
+            (1, 1, 2, 2),
+            (3, 3, 4, 4),
+        ),
+        (
+            (1, 1, 2, 2),
+            (3, 3, 4, 4),
+        ),
+    ),
+    (
+        (  # A completely envelopped Rect gets absorbed.
+            (1, 1, 4, 4),
+            (2, 2, 3, 3),
+        ),
+        (
+            (1, 1, 4, 4),
+        ),
+    ),
+    (
+        (  # Adjacent Rects intersect with each other.
+            (1, 1, 2, 2),
+            (2, 2, 3, 3),
+        ),
+        (
+            (1, 1, 3, 3),
+        ),
+    ),
+    (
+        (  # Rects that share a vertical span get joined, too.
+            (1, 1, 4, 2),
+            (2, 1, 6, 2),
+            (3, 5, 4, 6),
+        ),
+        (
+            (1, 1, 6, 2),
+            (3, 5, 4, 6),
+        ),
+    ),
+    (
+        (  # Two pairs of Rects bridged by a fifth.
+            (0, 0, 1, 1),
+            (1, 0, 2, 1),
+            (0, 2, 1, 3),
+            (1, 2, 2, 3),
+            (2, 0, 3, 3),
+        ),
+        (
+            (0, 0, 3, 3),
+        ),
+    ),
+    (
+        (  # "Transitively" ntersecting Rects get joined into the same BBox.
+            (1, 2, 3, 4),
+            (2, 3, 4, 5),
+            (4, 5, 6, 7),
+            (5, 6, 7, 8),
+        ),
+        (
+            (1, 2, 7, 8),
+        ),
+    ),
+    (
+        (  # And so on.
+            (1, 2, 2, 3),
+            (2, 3, 3, 4),
+            (5, 6, 6, 7),
+            (6, 7, 7, 8),
+            (11, 12, 12, 13),
+            (12, 13, 13, 14),
+            (15, 16, 16, 17),
+            (16, 17, 17, 18),
+            (10, 20, 20, 30),
+            (20, 30, 30, 40),
+            (50, 60, 60, 70),
+            (60, 70, 70, 80),
+        ),
+        (
+            (1, 2, 3, 4),
+            (5, 6, 7, 8),
+            (11, 12, 13, 14),
+            (15, 16, 17, 18),
+            (10, 20, 30, 40),
+            (50, 60, 70, 80),
+        ),
+    ),
+)
+
+
+@pytest.mark.parametrize("rects, expected", ENCLOSURE_CASES)
+def test_enclosures(rects, expected):
+    rects = [Rect(r) for r in rects]
+    expected = sorted(tuple(Rect(r)) for r in expected)
+    assert sorted(tuple(r) for r in Rect.bounding_boxes(rects)) == expected
+    assert sorted(tuple(r) for r in Rect.bounding_boxes(rects, unique=True)) == expected
@@ -0,0 +1,30 @@
+"""Micro-benchmarks for the hot Rect operations.
+
+Benchmarks are disabled in the default test run (see addopts in
+pyproject.toml); run them with:
+
+    pytest --benchmark-enable --benchmark-only
+"""
+
+from pyraxial import Rect
+
+
+def test_bench_new(benchmark):
+    benchmark(Rect, (1, 2, 3, 4))
+
+
+def test_bench_or(benchmark):
+    a = Rect((1, 1, 3, 3))
+    b = Rect((2, 2, 4, 4))
+    benchmark(lambda: a | b)
+
+
+def test_bench_and(benchmark):
+    a = Rect((1, 1, 3, 3))
+    b = Rect((2, 2, 4, 4))
+    benchmark(lambda: a & b)
+
+
+def test_bench_bounding_boxes(benchmark):
+    rects = [Rect((i, i, i + 2, i + 2)) for i in range(1000)]
+    benchmark(lambda: list(Rect.bounding_boxes(rects)))